@@ -74,16 +74,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     data = dict(entry.data)
     options = dict(entry.options)
     for ent in PP_OPT_SCHEMA:
-        if ent["field"] in data:
-            options[ent["field"]] = data[ent["field"]]
-            del data[ent["field"]]
-        if ent["field"] not in options:
-            options[ent["field"]] = ent.get("default")
+        if ent.field in data:
+            options[ent.field] = data[ent.field]
+            del data[ent.field]
+        if ent.field not in options:
+            options[ent.field] = ent.default
 
     for schema in (PP_SCHEMA, PP_SCHEMA_ADV):
         for ent in schema:
-            if ent["field"] not in data:
-                data[ent["field"]] = ent.get("default")
+            if ent.field not in data:
+                data[ent.field] = ent.default
 
     if data != entry.data or options != entry.options:
         hass.config_entries.async_update_entry(entry, data=data, options=options)
@@ -91,7 +91,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     name = entry.data.get(CONF_NAME)
     host = entry.data.get(CONF_HOST)
     port = entry.data.get(CONF_PORT)
-    device_id = f"{host}:{port}"
 
     client = PowerPetDoorClient(
         host=host,
@@ -101,6 +100,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         keepalive=entry.options.get(CONF_KEEP_ALIVE),
         loop=hass.loop,
     )
+    device_id = client.endpoint
 
     device_info = DeviceInfo(
         identifiers={(DOMAIN, device_id)},
@@ -40,7 +40,7 @@ class PetDoorButton(ButtonEntity):
 
         self._attr_name = name
         self._attr_device_info = device
-        self._attr_unique_id = f"{client.host}:{client.port}-button"
+        self._attr_unique_id = f"{client.endpoint}-button"
 
         client.add_listener(name=self.unique_id, door_status_update=self.handle_state_update, sensor_update={FIELD_POWER: self.handle_power_update})
 
@@ -132,6 +132,7 @@ class PowerPetDoorClient:
         self.cfg_keepalive = keepalive
         self.cfg_timeout = timeout
         self.cfg_reconnect = reconnect
+        self.endpoint = f"{host}:{port}"
 
         self._shutdown = False
         self._ownLoop = False
@@ -148,6 +149,8 @@ class PowerPetDoorClient:
         self._buffer = ''
         self._outstanding = {}
         self._queue = queue.SimpleQueue()
+        self._cancelled = set()
+        self._last_sent_id = 0
 
         if loop:
             _LOGGER.info("Latching onto an existing event loop.")
@@ -345,7 +348,7 @@ class PowerPetDoorClient:
 
     async def connect(self) -> None:
         """Internal method for making the physical connection."""
-        _LOGGER.info(str.format("Started to connect to Power Pet Door... at {0}:{1}", self.cfg_host, self.cfg_port))
+        _LOGGER.info("Started to connect to Power Pet Door... at %s:%s", self.cfg_host, self.cfg_port)
         try:
             async with async_timeout.timeout(self.cfg_timeout):
                 coro = self._eventLoop.create_connection(lambda: self, self.cfg_host, self.cfg_port)
@@ -389,6 +392,7 @@ class PowerPetDoorClient:
         self._failed_pings = 0
         self._buffer = ''
         self._queue = queue.SimpleQueue()
+        self._cancelled = set()
 
         if self._keepalive:
             self._keepalive.cancel()
@@ -421,10 +425,10 @@ class PowerPetDoorClient:
             if self._last_ping is not None:
                 self._failed_pings += 1
                 if self._failed_pings < MAX_FAILED_PINGS:
-                    _LOGGER.warning('Last PING not responded to {} of {}...'.format(self._failed_pings,
-                        MAX_FAILED_PINGS))
+                    _LOGGER.warning('Last PING not responded to %s of %s...', self._failed_pings,
+                        MAX_FAILED_PINGS)
                 else:
-                    _LOGGER.error('Last PING not responded to {} times.'.format(self._failed_pings))
+                    _LOGGER.error('Last PING not responded to %s times.', self._failed_pings)
                     self.disconnect()
                     return
 
@@ -437,9 +441,9 @@ class PowerPetDoorClient:
         if _check_receipt and not _check_receipt.cancelled():
             self._failed_msg += 1
             if self._failed_msg < MAX_FAILED_MSG:
-                _LOGGER.warning('Did not receive a response to a {} message in more than {} seconds, retrying.'.format(self._last_command, self.cfg_timeout))
+                _LOGGER.warning('Did not receive a response to a %s message in more than %s seconds, retrying.', self._last_command, self.cfg_timeout)
             else:
-                _LOGGER.error('Did not receive a response to a {} message in more than {} seconds {} times, dropped.'.format(self._last_command, self.cfg_timeout, self._failed_msg))
+                _LOGGER.error('Did not receive a response to a %s message in more than %s seconds %s times, dropped.', self._last_command, self.cfg_timeout, self._failed_msg)
                 self._failed_msg = 0
         else:
             self._failed_msg = 0
@@ -468,7 +472,8 @@ class PowerPetDoorClient:
             diff = time.time() - self._last_send
             if diff < MINIMUM_TIME_BETWEEN_MSGS:
                 await asyncio.sleep(MINIMUM_TIME_BETWEEN_MSGS - diff)
-            _LOGGER.debug(str.format('TX > {0}', rawdata.decode('ascii')))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug('TX > %s', rawdata.decode('ascii'))
             self._transport.write(rawdata)
             self._last_send = time.time()
 
@@ -481,7 +486,7 @@ class PowerPetDoorClient:
                 await self.dequeue_data()
 
         except RuntimeError as err:
-            _LOGGER.error(str.format('Failed to write to the stream. ({0}) ', err))
+            _LOGGER.error('Failed to write to the stream. (%s) ', err)
             self.disconnect()
 
     async def dequeue_data(self) -> None:
@@ -500,6 +505,15 @@ class PowerPetDoorClient:
 
         try:
             data = self._queue.get_nowait()
+            # Nobody is waiting on a cancelled message any more, so don't send it.
+            while data["msgId"] in self._cancelled:
+                self._cancelled.discard(data["msgId"])
+                if self._queue.empty():
+                    self._can_dequeue = True
+                    return
+                data = self._queue.get_nowait()
+            self._last_sent_id = data["msgId"]
+
             if COMMAND in data:
                 self._last_command = data[COMMAND]
             elif CONFIG in data:
@@ -522,7 +536,7 @@ class PowerPetDoorClient:
         if rawdata != '':
             try:
                 data = rawdata.decode('ascii')
-                _LOGGER.debug(str.format('RX < {0}', data))
+                _LOGGER.debug('RX < %s', data)
 
                 self._buffer += data
             except:
@@ -535,11 +549,11 @@ class PowerPetDoorClient:
                 self._buffer = self._buffer[end:]
 
                 try:
-                    _LOGGER.debug(f"Parsing: {block}")
+                    _LOGGER.debug("Parsing: %s", block)
                     self.ensure_future(self.process_message(json.loads(block)))
 
                 except json.JSONDecodeError as err:
-                    _LOGGER.error(str.format('Failed to decode JSON block ({0}) ', err))
+                    _LOGGER.error('Failed to decode JSON block (%s) ', err)
 
                 end = find_end(self._buffer)
 
@@ -805,8 +819,9 @@ class PowerPetDoorClient:
 
         else:
             if future:
-                future.set_exception("Command Failed")
-            _LOGGER.warning("Error reported: {}".format(json.dumps(msg)))
+                future.set_exception(Exception("Command Failed"))
+            if _LOGGER.isEnabledFor(logging.WARNING):
+                _LOGGER.warning("Error reported: %s", json.dumps(msg))
 
     def send_message(self, type: str, arg: str, notify: bool = False, **kwargs) -> None:
         msgId = self.msgId
@@ -817,6 +832,8 @@ class PowerPetDoorClient:
 
             def cleanup(arg: asyncio.Future) -> None:
                 del self._outstanding[msgId]
+                if arg.cancelled() and msgId > self._last_sent_id:
+                    self._cancelled.add(msgId)
             rv.add_done_callback(cleanup)
 
         self.msgId += 1
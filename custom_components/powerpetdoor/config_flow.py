@@ -127,11 +127,11 @@ class PowerPetDoorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         data = {}
         for schema in (PP_SCHEMA, PP_SCHEMA_ADV):
             for entry in schema:
-                data[entry["field"]] = user_input.get(entry["field"], entry.get("default"))
+                data[entry.field] = user_input.get(entry.field, entry.default)
 
         options = {}
         for entry in PP_OPT_SCHEMA:
-            options[entry["field"]] = user_input.get(entry["field"], entry.get("default"))
+            options[entry.field] = user_input.get(entry.field, entry.default)
 
         name = data.get(CONF_NAME)
         host = data.get(CONF_HOST)
@@ -1,5 +1,7 @@
 """ Constant Variables """
 
+import re
+
 from homeassistant.const import (
     CONF_NAME,
     CONF_HOST,
@@ -146,6 +148,6 @@ CMD_GET_SCHEDULE = "GET_SCHEDULE"
 CMD_SET_SCHEDULE = "SET_SCHEDULE"
 CMD_DELETE_SCHEDULE = "DELETE_SCHEDULE"
 
-ValidIpAddressRegex = r"^(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])$"
-ValidHostnameRegex = r"^(([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9])\.)*([A-Za-z0-9]|[A-Za-z0-9][A-Za-z0-9\-]*[A-Za-z0-9])$"
-ValidTZRegex = r"^$"
\ No newline at end of file
+ValidIpAddressRegex = re.compile(r"^(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])$")
+ValidHostnameRegex = re.compile(r"^(([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9])\.)*([A-Za-z0-9]|[A-Za-z0-9][A-Za-z0-9\-]*[A-Za-z0-9])$")
+ValidTZRegex = re.compile(r"^$")
\ No newline at end of file
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
@@ -8,6 +8,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.cover import CoverEntity, CoverDeviceClass, CoverEntityFeature
+from homeassistant.util import dt as dt_util
 from .client import PowerPetDoorClient
 
 from .const import (
@@ -64,7 +65,7 @@ class PetDoor(CoordinatorEntity, CoverEntity):
 
         self._attr_name = name
         self._attr_device_info = device
-        self._attr_unique_id = f"{client.host}:{client.port}-door"
+        self._attr_unique_id = f"{client.endpoint}-door"
 
         client.add_listener(name=self.unique_id,
                             door_status_update=self.handle_state_update,
@@ -125,7 +126,7 @@ class PetDoor(CoordinatorEntity, CoverEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.last_change = datetime.now(timezone.utc)
+        self.last_change = dt_util.utcnow()
         super()._handle_coordinator_update()
 
     @callback
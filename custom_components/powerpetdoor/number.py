@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import EntityCategory
@@ -9,6 +9,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry, SOURCE_IMPORT
 from homeassistant.components.number import NumberEntity, NumberDeviceClass, NumberMode, DEFAULT_MIN_VALUE, DEFAULT_MAX_VALUE, DEFAULT_STEP
+from homeassistant.util import dt as dt_util
 from .client import PowerPetDoorClient
 
 from homeassistant.const import UnitOfTime, UnitOfElectricPotential
@@ -110,7 +111,7 @@ class PetDoorNumber(CoordinatorEntity, NumberEntity):
         self._attr_mode = number.get("mode", NumberMode.AUTO)
         self._attr_entity_registry_enabled_default = not number.get("disabled", False)
         self._attr_device_info = device
-        self._attr_unique_id = f"{client.host}:{client.port}-{number['field']}"
+        self._attr_unique_id = f"{client.endpoint}-{number['field']}"
 
         client.add_listener(name=self.unique_id, **{number["update"]: self.handle_state_update},
                             sensor_update={FIELD_POWER: self.handle_power_update})
@@ -134,7 +135,7 @@ class PetDoorNumber(CoordinatorEntity, NumberEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.last_change = datetime.now(timezone.utc)
+        self.last_change = dt_util.utcnow()
         super()._handle_coordinator_update()
 
     @callback
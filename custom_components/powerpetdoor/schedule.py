@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from datetime import datetime, time, timezone, timedelta
-from copy import deepcopy
+import asyncio
+import heapq
+from collections import defaultdict
+from collections.abc import Iterable
+from itertools import chain
+from datetime import time, timedelta
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import EntityCategory
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity, UpdateFailed
 from homeassistant.config_entries import ConfigEntry, SOURCE_IMPORT
 from homeassistant.components.schedule import Schedule, WEEKDAY_TO_CONF, CONF_FROM, CONF_TO, ENTITY_SCHEMA
+from homeassistant.util import dt as dt_util
 from .client import PowerPetDoorClient
 
 from .const import (
@@ -45,10 +50,17 @@ import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+_IN_START = FIELD_INSIDE_PREFIX + FIELD_START_TIME_SUFFIX
+_IN_END = FIELD_INSIDE_PREFIX + FIELD_END_TIME_SUFFIX
+_OUT_START = FIELD_OUTSIDE_PREFIX + FIELD_START_TIME_SUFFIX
+_OUT_END = FIELD_OUTSIDE_PREFIX + FIELD_END_TIME_SUFFIX
+
 SCHEDULES = {
     "inside": {
         "field": FIELD_INSIDE,
         "prefix": FIELD_INSIDE_PREFIX,
+        "start_key": _IN_START,
+        "end_key": _IN_END,
         "icon": "mdi:home-clock",
         "category": EntityCategory.CONFIG,
         "disabled": True,
@@ -56,6 +68,8 @@ SCHEDULES = {
     "outside": {
         "field": FIELD_OUTSIDE,
         "prefix": FIELD_OUTSIDE_PREFIX,
+        "start_key": _OUT_START,
+        "end_key": _OUT_END,
         "icon": "mdi:sun-clock",
         "category": EntityCategory.CONFIG,
         "disabled": True,
@@ -71,166 +85,262 @@ def week_0_sun_to_mon(val: int) -> int:
     return (val + 6) % 7
 
 
-schedule_template = {
-    FIELD_INDEX: 0,
-    FIELD_DAYSOFWEEK: [0, 0, 0, 0, 0, 0, 0],
-    FIELD_INSIDE: False,
-    FIELD_OUTSIDE: False,
-    FIELD_ENABLED: True,
-    FIELD_INSIDE_PREFIX + FIELD_START_TIME_SUFFIX: {FIELD_HOUR: 0, FIELD_MINUTE: 0},
-    FIELD_INSIDE_PREFIX + FIELD_END_TIME_SUFFIX: {FIELD_HOUR: 0, FIELD_MINUTE: 0},
-    FIELD_OUTSIDE_PREFIX + FIELD_START_TIME_SUFFIX: {FIELD_HOUR: 0, FIELD_MINUTE: 0},
-    FIELD_OUTSIDE_PREFIX + FIELD_END_TIME_SUFFIX: {FIELD_HOUR: 0, FIELD_MINUTE: 0},
-}
+# The door's latest end time is 23:59, which HA expresses as the end of the day (time.max).
+_LAST_MINUTE = 23 * 60 + 59
+
+_WEEKDAY_ITEMS = tuple((dayName, week_0_mon_to_sun(day)) for day, dayName in WEEKDAY_TO_CONF.items())
+_SUN_TO_MON = tuple(week_0_sun_to_mon(day) for day in range(7))
+_WEEKDAY_CONF_SUN_TO_MON = tuple(WEEKDAY_TO_CONF[_SUN_TO_MON[day]] for day in range(7))
+
+
+def days_to_mask(days: list) -> int:
+    """ Pack the door's 7 element days of week list into a bitmask (bit 0 is Sunday). """
+    mask = 0
+    for day, enabled in enumerate(days):
+        if enabled:
+            mask |= 1 << day
+    return mask
+
+
+def mask_to_days(mask: int) -> list:
+    """ Expand a days of week bitmask back into the door's 7 element list. """
+    return [(mask >> day) & 1 for day in range(7)]
+
+
+def time_to_minutes(value: dict) -> int:
+    """ Convert one of the door's {hour, min} times into minutes since midnight. """
+    return value[FIELD_HOUR] * 60 + value[FIELD_MINUTE]
+
+
+def _new_schedule_row(index: int,
+                      days: list,
+                      inside: bool = False,
+                      outside: bool = False,
+                      in_start: tuple = (0, 0),
+                      in_end: tuple = (0, 0),
+                      out_start: tuple = (0, 0),
+                      out_end: tuple = (0, 0)) -> dict:
+    """ Build a fresh schedule entry in the door's format, times are (hour, minute). """
+    return {
+        FIELD_INDEX: index,
+        FIELD_DAYSOFWEEK: days,
+        FIELD_INSIDE: inside,
+        FIELD_OUTSIDE: outside,
+        FIELD_ENABLED: True,
+        _IN_START: {FIELD_HOUR: in_start[0], FIELD_MINUTE: in_start[1]},
+        _IN_END: {FIELD_HOUR: in_end[0], FIELD_MINUTE: in_end[1]},
+        _OUT_START: {FIELD_HOUR: out_start[0], FIELD_MINUTE: out_start[1]},
+        _OUT_END: {FIELD_HOUR: out_end[0], FIELD_MINUTE: out_end[1]},
+    }
 
-def compress_schedule(schedule: dict) -> dict:
+def compress_schedule(schedule: Iterable[dict]) -> list[dict]:
     """ Take the schedule and reduce it to as few entries as possible. """
     expanded_sched = {
-        FIELD_INSIDE: {},
-        FIELD_OUTSIDE: {},
+        FIELD_INSIDE: [[] for _ in range(7)],
+        FIELD_OUTSIDE: [[] for _ in range(7)],
     }
 
-    # Step 1 .. expand
+    # Step 1 .. expand (times are minutes since midnight from here on)
     for sched in schedule:
-        in_start = time(sched[FIELD_INSIDE_PREFIX + FIELD_START_TIME_SUFFIX][FIELD_HOUR],
-                        sched[FIELD_INSIDE_PREFIX + FIELD_START_TIME_SUFFIX][FIELD_MINUTE])
-        in_end = time(sched[FIELD_INSIDE_PREFIX + FIELD_END_TIME_SUFFIX][FIELD_HOUR],
-                      sched[FIELD_INSIDE_PREFIX + FIELD_END_TIME_SUFFIX][FIELD_MINUTE])
+        in_start = time_to_minutes(sched[_IN_START])
+        in_end = time_to_minutes(sched[_IN_END])
         if in_end < in_start:
             in_start, in_end = in_end, in_start
-        out_start = time(sched[FIELD_OUTSIDE_PREFIX + FIELD_START_TIME_SUFFIX][FIELD_HOUR],
-                         sched[FIELD_OUTSIDE_PREFIX + FIELD_START_TIME_SUFFIX][FIELD_MINUTE])
-        out_end = time(sched[FIELD_OUTSIDE_PREFIX + FIELD_END_TIME_SUFFIX][FIELD_HOUR],
-                       sched[FIELD_OUTSIDE_PREFIX + FIELD_END_TIME_SUFFIX][FIELD_MINUTE])
+        out_start = time_to_minutes(sched[_OUT_START])
+        out_end = time_to_minutes(sched[_OUT_END])
         if out_end < out_start:
             out_start, out_end = out_end, out_start
 
-        for day in range(len(sched[FIELD_DAYSOFWEEK])):
-            if sched[FIELD_DAYSOFWEEK][day]:
-                if sched[FIELD_INSIDE]:
-                    daysched = expanded_sched[FIELD_INSIDE].setdefault(day, [])
-                    daysched.append({"start": in_start, "end": in_end})
-                if sched[FIELD_OUTSIDE]:
-                    daysched = expanded_sched[FIELD_OUTSIDE].setdefault(day, [])
-                    daysched.append({"start": out_start, "end": out_end})
+        mask = days_to_mask(sched[FIELD_DAYSOFWEEK])
+        while mask:
+            day = (mask & -mask).bit_length() - 1
+            mask &= mask - 1
+            if sched[FIELD_INSIDE]:
+                expanded_sched[FIELD_INSIDE][day].append((in_start, in_end))
+            if sched[FIELD_OUTSIDE]:
+                expanded_sched[FIELD_OUTSIDE][day].append((out_start, out_end))
 
     # Step 2 .. Combine adjacent or overlapping
-    def combine_overlapping(xsched: dict) -> None:
-        for daysched in xsched.values():
-            daysched.sort(key=lambda d: d["start"])
-
-            i=0
-            while i < len(daysched) - 1:
-                if daysched[i]["end"] >= daysched[i + 1]["start"]:
-                    if daysched[i]["end"] < daysched[i + 1]["end"]:
-                        daysched[i]["end"] = daysched[i + 1]["end"]
-                    del daysched[i + 1]
+    def combine_overlapping(xsched: list) -> None:
+        for day, daysched in enumerate(xsched):
+            if not daysched:
+                continue
+            daysched.sort()
+
+            merged = []
+            start, end = daysched[0]
+            for next_start, next_end in daysched[1:]:
+                if next_start <= end:
+                    end = max(end, next_end)
                 else:
-                    i = i + 1
+                    merged.append((start, end))
+                    start, end = next_start, next_end
+            merged.append((start, end))
+            xsched[day] = merged
 
     combine_overlapping(expanded_sched[FIELD_INSIDE])
     combine_overlapping(expanded_sched[FIELD_OUTSIDE])
 
     # Step 3 .. Combine days of week
-    def collapse_split_field(xsched: dict) -> list:
-        out = []
-        for day, daysched in xsched.items():
-            for sched in daysched:
-                found = False
-                for ent in out:
-                    if ent["start"] == sched["start"] and ent["end"] == sched["end"]:
-                        ent[FIELD_DAYSOFWEEK][day] = 1
-                        found = True
-                        break
-                if not found:
-                    ent = {
-                        "start": sched["start"],
-                        "end": sched["end"],
-                        FIELD_DAYSOFWEEK: [0, 0, 0, 0, 0, 0, 0]
-                    }
-                    ent[FIELD_DAYSOFWEEK][day] = 1
-                    out.append(ent)
-        return out
-
-    split_sched = {
-        FIELD_INSIDE: collapse_split_field(expanded_sched[FIELD_INSIDE]),
-        FIELD_OUTSIDE: collapse_split_field(expanded_sched[FIELD_OUTSIDE]),
-    }
-
-    # Step 4 .. Combine Inside & Outside entries
-    final_sched = []
-    for sched in split_sched[FIELD_INSIDE]:
-        ent = {
-            FIELD_INSIDE: True,
-            FIELD_OUTSIDE: False,
-            FIELD_DAYSOFWEEK: sched[FIELD_DAYSOFWEEK],
-            "start": sched["start"],
-            "end": sched["end"],
-        }
-        final_sched.append(ent)
-    for sched in split_sched[FIELD_OUTSIDE]:
-        found = False
-        for ent in final_sched:
-            if (ent["start"] == sched["start"] and
-                    ent["end"] == sched["end"] and
-                    ent[FIELD_DAYSOFWEEK] == sched[FIELD_DAYSOFWEEK]):
-                ent[FIELD_OUTSIDE] = True
-                found = True
-                break
-        if not found:
-            ent = {
-                FIELD_INSIDE: False,
-                FIELD_OUTSIDE: True,
-                FIELD_DAYSOFWEEK: sched[FIELD_DAYSOFWEEK],
-                "start": sched["start"],
-                "end": sched["end"],
-            }
-            final_sched.append(ent)
+    groups = {}
+    for field in (FIELD_INSIDE, FIELD_OUTSIDE):
+        for day, daysched in enumerate(expanded_sched[field]):
+            for interval in daysched:
+                key = (field, interval)
+                groups[key] = groups.get(key, 0) | (1 << day)
+
+    # Step 4 .. Combine Inside & Outside entries with the same times and days
+    final_sched = {}
+    for (field, (start, end)), mask in groups.items():
+        final_sched.setdefault((start, end, mask), set()).add(field)
 
     # Step 5, make template rows
     out = []
-    index = 0
-    for sched in final_sched:
-        ent = deepcopy(schedule_template)
-        ent[FIELD_INDEX] = index
-        ent[FIELD_DAYSOFWEEK] = sched[FIELD_DAYSOFWEEK]
-        if sched[FIELD_INSIDE]:
-            ent[FIELD_INSIDE] = True
-            ent[FIELD_INSIDE_PREFIX + FIELD_START_TIME_SUFFIX][FIELD_HOUR] = sched["start"].hour
-            ent[FIELD_INSIDE_PREFIX + FIELD_START_TIME_SUFFIX][FIELD_MINUTE] = sched["start"].minute
-            ent[FIELD_INSIDE_PREFIX + FIELD_END_TIME_SUFFIX][FIELD_HOUR] = sched["end"].hour
-            ent[FIELD_INSIDE_PREFIX + FIELD_END_TIME_SUFFIX][FIELD_MINUTE] = sched["end"].minute
-        if sched[FIELD_OUTSIDE]:
-            ent[FIELD_OUTSIDE] = True
-            ent[FIELD_OUTSIDE_PREFIX + FIELD_START_TIME_SUFFIX][FIELD_HOUR] = sched["start"].hour
-            ent[FIELD_OUTSIDE_PREFIX + FIELD_START_TIME_SUFFIX][FIELD_MINUTE] = sched["start"].minute
-            ent[FIELD_OUTSIDE_PREFIX + FIELD_END_TIME_SUFFIX][FIELD_HOUR] = sched["end"].hour
-            ent[FIELD_OUTSIDE_PREFIX + FIELD_END_TIME_SUFFIX][FIELD_MINUTE] = sched["end"].minute
+    for index, ((start, end, mask), fields) in enumerate(final_sched.items()):
+        inside = FIELD_INSIDE in fields
+        outside = FIELD_OUTSIDE in fields
+        start = divmod(start, 60)
+        end = divmod(end, 60)
+        ent = _new_schedule_row(index, mask_to_days(mask), inside=inside, outside=outside,
+                                in_start=start if inside else (0, 0), in_end=end if inside else (0, 0),
+                                out_start=start if outside else (0, 0), out_end=end if outside else (0, 0))
         out.append(ent)
-        index + 1
 
     return out
 
 
+def schedule_entry_key(entry: dict) -> tuple:
+    """ Key identifying what a schedule entry does, ignoring its index. """
+    def side_key(enabled: bool, start_key: str, end_key: str) -> tuple | None:
+        if not enabled:
+            return None
+        return time_to_minutes(entry[start_key]), time_to_minutes(entry[end_key])
+
+    return (days_to_mask(entry[FIELD_DAYSOFWEEK]),
+            entry.get(FIELD_ENABLED, True),
+            side_key(entry[FIELD_INSIDE], _IN_START, _IN_END),
+            side_key(entry[FIELD_OUTSIDE], _OUT_START, _OUT_END))
+
+
+def compute_schedule_diff(current_schedule: list, new_schedule: list) -> tuple[list, list]:
+    """ Work out which device entries must be deleted and which new entries must be added. """
+    keyed_current = [(schedule_entry_key(ent), ent) for ent in current_schedule]
+    current = dict(keyed_current)
+    new = {schedule_entry_key(ent): ent for ent in new_schedule}
+
+    # Only one device entry is kept per key, any duplicates are deleted too.
+    indices_to_delete = [ent[FIELD_INDEX] for key, ent in keyed_current
+                         if key not in new or current[key] is not ent]
+    entries_to_add = [new[key] for key in new.keys() - current.keys()]
+    return indices_to_delete, entries_to_add
+
+
+async def send_schedule_requests(client: PowerPetDoorClient, requests: list[tuple[str, int, dict]]) -> list:
+    """ Send all the given schedule requests at once, and wait a bounded time for their replies.
+
+    Requests that fail, or go unanswered, are logged and have a result of None. Unanswered
+    requests are cancelled, so the client won't send them if they are still queued.
+    """
+    futures = [client.send_message(CONFIG, cmd, index=idx, notify=True, **args) for cmd, idx, args in requests]
+    if not futures:
+        return []
+    # The door answers one message at a time, so allow a reply timeout for each request.
+    await asyncio.wait(futures, timeout=client.cfg_timeout * (len(futures) + 1))
+    results = []
+    for (cmd, idx, _), future in zip(requests, futures):
+        if not future.done():
+            _LOGGER.warning("No reply to %s for schedule entry %s, giving up.", cmd, idx)
+            future.cancel()
+            results.append(None)
+        elif future.cancelled() or future.exception():
+            _LOGGER.warning("%s for schedule entry %s failed: %s", cmd, idx,
+                            "cancelled" if future.cancelled() else future.exception())
+            results.append(None)
+        else:
+            results.append(future.result())
+    return results
+
+
+async def get_schedule_list(client: PowerPetDoorClient) -> list:
+    """ Fetch the indices of the door's schedule entries, raising UpdateFailed if the door doesn't answer. """
+    try:
+        return await asyncio.wait_for(client.send_message(CONFIG, CMD_GET_SCHEDULE_LIST, notify=True),
+                                      timeout=client.cfg_timeout * 2)
+    except asyncio.TimeoutError as err:
+        raise UpdateFailed(f"No reply to {CMD_GET_SCHEDULE_LIST}") from err
+
+
+async def get_schedule_entries(client: PowerPetDoorClient, schedule_list: list) -> list[dict]:
+    """ Fetch the given schedule entries from the door, requesting them all at once.
+
+    Raises UpdateFailed if any entry could not be fetched, a partial schedule is never returned.
+    """
+    results = await send_schedule_requests(client, [(CMD_GET_SCHEDULE, idx, {}) for idx in schedule_list])
+    missing = [idx for idx, result in zip(schedule_list, results) if result is None]
+    if missing:
+        raise UpdateFailed(f"Failed to retrieve schedule entries {missing}")
+    return results
+
+
+def parse_schedule(schedule: list | None) -> dict:
+    """ Split the door's schedule into (days mask, start, end) entries for each schedule field.
+        Times are minutes since midnight. """
+    parsed = {side["field"]: [] for side in SCHEDULES.values()}
+    for sched in schedule or []:
+        # Disabled entries don't apply, so they aren't part of either schedule.
+        if not sched.get(FIELD_ENABLED, True):
+            continue
+        mask = days_to_mask(sched[FIELD_DAYSOFWEEK])
+        for side in SCHEDULES.values():
+            if sched[side["field"]]:
+                start = time_to_minutes(sched[side["start_key"]])
+                end = time_to_minutes(sched[side["end_key"]])
+                parsed[side["field"]].append((mask, start, end))
+    return parsed
+
+
+class ScheduleCoordinator(DataUpdateCoordinator):
+    """ Coordinator that parses the door's schedule once, for all schedule entities sharing it. """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.parsed = parse_schedule(None)
+        self.last_update_utc = None
+
+    async def _async_update_data(self) -> list[dict]:
+        data = await super()._async_update_data()
+        self.parsed = parse_schedule(data)
+        self.last_update_utc = dt_util.utcnow()
+        return data
+
+    @callback
+    def async_set_updated_data(self, data: list[dict]) -> None:
+        self.parsed = parse_schedule(data)
+        self.last_update_utc = dt_util.utcnow()
+        super().async_set_updated_data(data)
+
+
 class PetDoorSchedule(CoordinatorEntity, Schedule):
     def __init__(self,
                  client: PowerPetDoorClient,
                  name: str,
                  schedule: dict,
-                 coordinator: DataUpdateCoordinator,
+                 coordinator: ScheduleCoordinator,
                  device: DeviceInfo | None = None) -> None:
         conf = {
             CONF_NAME: name,
             CONF_ICON: schedule["icon"],
-            CONF_ID: f"{client.host}:{client.port}-schedule-{schedule['field']}",
+            CONF_ID: f"{client.endpoint}-schedule-{schedule['field']}",
         }
         CoordinatorEntity.__init__(self, coordinator)
         Schedule.__init__(self, config=conf, editable=True)
         self.client = client
         self.schedule = schedule
+        self._field = schedule["field"]
 
         self.last_change = None
         self.power = True
+        self._last_parsed = None
 
         if "category" in schedule:
             self._attr_entity_category = schedule["category"]
@@ -253,67 +363,100 @@ class PetDoorSchedule(CoordinatorEntity, Schedule):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.last_change = datetime.now(timezone.utc)
+        self.last_change = self.coordinator.last_update_utc
         if self.coordinator.data:
+            # A refresh usually returns the same schedule, there is nothing to rebuild then.
+            # The state is still written, as availability follows the coordinator's last refresh.
+            parsed = self.coordinator.parsed[self._field]
+            if parsed == self._last_parsed:
+                self.async_write_ha_state()
+                return
+            self._last_parsed = parsed
+
             conf = {
                 CONF_NAME: self._attr_name,
                 CONF_ICON: self._attr_icon,
                 CONF_ID: self._attr_unique_id,
             }
-            for sched in self.coordinator.data:
-                if sched[self.schedule["field"]]:
-                    start = time(sched[self.schedule["prefix"] + FIELD_START_TIME_SUFFIX][FIELD_HOUR],
-                                 sched[self.schedule["prefix"] + FIELD_START_TIME_SUFFIX][FIELD_MINUTE])
-                    end = time(sched[self.schedule["prefix"] + FIELD_END_TIME_SUFFIX][FIELD_HOUR],
-                               sched[self.schedule["prefix"] + FIELD_END_TIME_SUFFIX][FIELD_MINUTE])
-                    if end.hour == 23 and end.minute == 59:
-                        end = time.max
-
-                    for day in range(len(sched[FIELD_DAYSOFWEEK])):
-                        if sched[FIELD_DAYSOFWEEK][day]:
-                            weekday = conf.setdefault(WEEKDAY_TO_CONF[week_0_sun_to_mon(day)], [])
-                            weekday.append({CONF_FROM: start, CONF_TO: end, })
+            weekdays = defaultdict(list)
+            for mask, start, end in parsed:
+                start = time(*divmod(start, 60))
+                end = time.max if end == _LAST_MINUTE else time(*divmod(end, 60))
+                while mask:
+                    day = (mask & -mask).bit_length() - 1
+                    mask &= mask - 1
+                    weekdays[_WEEKDAY_CONF_SUN_TO_MON[day]].append({CONF_FROM: start, CONF_TO: end, })
+            conf.update(weekdays)
+
             self._config = ENTITY_SCHEMA(conf)
             self._clean_up_listener()
             self._update()
 
+    def _configured_rows(self, config: ConfigType) -> Iterable[dict]:
+        """ Build a door schedule row for each time range in the UI config. """
+        for dayName, day in _WEEKDAY_ITEMS:
+            for sched in config.get(dayName, ()):
+                # Door indices are assigned after the diff, so new rows start without one.
+                row = _new_schedule_row(0, mask_to_days(1 << day))
+                row[self._field] = True
+                row[self.schedule["start_key"]] = {FIELD_HOUR: sched[CONF_FROM].hour,
+                                                   FIELD_MINUTE: sched[CONF_FROM].minute}
+                row[self.schedule["end_key"]] = {FIELD_HOUR: sched[CONF_TO].hour,
+                                                 FIELD_MINUTE: sched[CONF_TO].minute}
+                yield row
+
     # UI-based update of this field.
     async def async_update_config(self, config: ConfigType) -> None:
-        if self.coordinator.data:
-            new_schedule = []
-            index = 0
-            for sched in self.coordinator.data.items():
-                if sched[FIELD_INSIDE] and sched[FIELD_OUTSIDE]:
-                    sched[self.schedule["field"]] = False
-                    sched[FIELD_INDEX] = index
-                    new_schedule.append(sched)
-                    index = index + 1
-                if not sched[self.schedule["field"]] and (sched[FIELD_INSIDE] or sched[FIELD_OUTSIDE]):
-                    sched[FIELD_INDEX] = index
-                    new_schedule.append(sched)
-                    index = index + 1
-
-            for day, dayName in WEEKDAY_TO_CONF.items():
-                if dayName in config:
-                    for sched in config[dayName]:
-                        schedule = deepcopy(schedule_template)
-                        schedule[FIELD_INDEX] = index
-                        schedule[FIELD_DAYSOFWEEK][week_0_mon_to_sun(day)] = 1
-                        schedule[self.schedule["field"]] = True
-                        schedule[self.schedule["prefix"] + FIELD_START_TIME_SUFFIX][FIELD_HOUR] = sched[CONF_FROM].hour
-                        schedule[self.schedule["prefix"] + FIELD_START_TIME_SUFFIX][FIELD_MINUTE] = sched[
-                            CONF_FROM].minute
-                        schedule[self.schedule["prefix"] + FIELD_END_TIME_SUFFIX][FIELD_HOUR] = sched[CONF_TO].hour
-                        schedule[self.schedule["prefix"] + FIELD_END_TIME_SUFFIX][FIELD_MINUTE] = sched[CONF_TO].minute
-                        new_schedule.append(schedule)
-                        index += 1
-
-            self.coordinator.async_set_updated_data(compress_schedule(new_schedule))
-            schedule_list = await self.client.send_message(CONFIG, CMD_GET_SCHEDULE_LIST)
-            for idx in schedule_list:
-                await self.client.send_message(CONFIG, CMD_DELETE_SCHEDULE, FIELD_INDEX=idx)
-            for sched in new_schedule:
-                await self.client.send_message(CONFIG, CMD_SET_SCHEDULE, FIELD_INDEX=sched[FIELD_INDEX], schedule=sched)
+        if self.coordinator.data is not None:
+            # Disabled entries aren't shown in either schedule, so they are carried over as they are.
+            field = self._field
+            disabled = [sched for sched in self.coordinator.data if not sched.get(FIELD_ENABLED, True)]
+            # Carry over what the other schedule owns, dropping our half of any shared entries.
+            carried = [{**sched, field: False} for sched in self.coordinator.data
+                       if sched.get(FIELD_ENABLED, True) and
+                       ((sched[FIELD_INSIDE] and sched[FIELD_OUTSIDE]) or
+                        (not sched[field] and (sched[FIELD_INSIDE] or sched[FIELD_OUTSIDE])))]
+            new_schedule = compress_schedule(chain(carried, self._configured_rows(config))) + disabled
+            if (frozenset(schedule_entry_key(sched) for sched in new_schedule) ==
+                    frozenset(schedule_entry_key(sched) for sched in self.coordinator.data)):
+                _LOGGER.debug("No changes to the %s schedule, not updating the door", self._field)
+                return
+
+            try:
+                schedule_list = await get_schedule_list(self.client)
+                current_schedule = await get_schedule_entries(self.client, schedule_list)
+            except UpdateFailed as err:
+                _LOGGER.error("Could not read the door's schedule, not saving the %s schedule: %s", self._field, err)
+                return
+
+            # Only touch the entries on the door that actually changed.
+            indices_to_delete, entries_to_add = compute_schedule_diff(current_schedule, new_schedule)
+
+            # Re-use the lowest freed indices first, the door's index space is limited.
+            free_indices = list(indices_to_delete)
+            heapq.heapify(free_indices)
+            next_idx = max(schedule_list) + 1 if schedule_list else 0
+            for sched in entries_to_add:
+                if free_indices:
+                    sched[FIELD_INDEX] = heapq.heappop(free_indices)
+                else:
+                    sched[FIELD_INDEX] = next_idx
+                    next_idx += 1
+
+            # The door also has a SET_SCHEDULE_LIST command, but its payload format is unknown, so each
+            # entry is sent on its own. Messages go out in the order they are queued, so deletes land
+            # before re-used indices are set.
+            requests = [(CMD_DELETE_SCHEDULE, idx, {}) for idx in indices_to_delete]
+            requests += [(CMD_SET_SCHEDULE, sched[FIELD_INDEX], {"schedule": sched}) for sched in entries_to_add]
+            results = await send_schedule_requests(self.client, requests)
+
+            # If anything went wrong, the door is the only reliable copy of the schedule.
+            if None in results:
+                await self.coordinator.async_request_refresh()
+                return
+            deleted = set(indices_to_delete)
+            self.coordinator.async_set_updated_data(
+                [sched for sched in current_schedule if sched[FIELD_INDEX] not in deleted] + entries_to_add)
 
     @callback
     def handle_power_update(self, state: bool) -> None:
@@ -332,13 +475,10 @@ async def async_setup_entry(hass: HomeAssistant,
 
     async def update_schedule() -> list[dict]:
         _LOGGER.debug("Requesting update of schedule")
-        schedule_list = await obj["client"].send_message(CONFIG, CMD_GET_SCHEDULE_LIST, notify=True)
-        schedule = []
-        for idx in schedule_list:
-            schedule.append(await obj["client"].send_message(CONFIG, CMD_GET_SCHEDULE, index=idx, notify=True))
-        return schedule
+        schedule_list = await get_schedule_list(obj["client"])
+        return await get_schedule_entries(obj["client"], schedule_list)
 
-    schedule_coordinator = DataUpdateCoordinator(
+    schedule_coordinator = ScheduleCoordinator(
         hass=hass,
         logger=_LOGGER,
         name=f"{name} Schedule",
@@ -1,4 +1,6 @@
-from typing import TypedDict, Any
+from dataclasses import dataclass
+from collections.abc import Sequence
+from typing import Any, Final
 from types import MappingProxyType
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -28,16 +30,20 @@ from .const import (
     ValidHostnameRegex,
 )
 
-class Entry(TypedDict):
+_TO_FLOAT = vol.Coerce(float)
+_HOST_VALIDATOR = vol.All(cv.string, vol.Any(vol.Match(ValidIpAddressRegex), vol.Match(ValidHostnameRegex)))
+
+@dataclass(slots=True, frozen=True)
+class Entry:
     field: str
-    description: str
-    msg: str
-    optional: bool
-    default: Any
-    input_schema: Any
-    validating_schema: Any
+    optional: bool = True
+    default: Any = None
+    description: str | None = None
+    msg: str | None = None
+    input_schema: Any = None
+    validating_schema: Any = None
 
-PP_SCHEMA: list[Entry] = [
+PP_SCHEMA: Final[tuple[Entry, ...]] = (
     Entry(
         field=CONF_NAME,
         optional=True,
@@ -48,109 +54,141 @@ PP_SCHEMA: list[Entry] = [
         field=CONF_HOST,
         optional=False,
         input_schema=cv.string,
-        validating_schema=vol.All(cv.string, vol.Any(vol.Match(ValidIpAddressRegex),
-                                                     vol.Match(ValidHostnameRegex))),
+        validating_schema=_HOST_VALIDATOR,
     ),
-]
+)
 
-PP_SCHEMA_ADV: list[Entry] = [
+PP_SCHEMA_ADV: Final[tuple[Entry, ...]] = (
     Entry(
         field=CONF_PORT,
         optional=True,
         default=DEFAULT_PORT,
         input_schema=cv.port
     ),
-]
+)
 
-PP_OPT_SCHEMA: list[Entry] = [
+PP_OPT_SCHEMA: Final[tuple[Entry, ...]] = (
     Entry(
         field=CONF_TIMEOUT,
         optional=False,
         default=DEFAULT_CONNECT_TIMEOUT,
-        input_schema=vol.Coerce(float)
+        input_schema=_TO_FLOAT
     ),
     Entry(
         field=CONF_RECONNECT,
         optional=False,
         default=DEFAULT_RECONNECT_TIMEOUT,
-        input_schema=vol.Coerce(float)
+        input_schema=_TO_FLOAT
     ),
     Entry(
         field=CONF_KEEP_ALIVE,
         optional=False,
         default=DEFAULT_KEEP_ALIVE_TIMEOUT,
-        input_schema=vol.Coerce(float)
+        input_schema=_TO_FLOAT
     ),
     Entry(
         field=CONF_REFRESH,
         optional=True,
         default=DEFAULT_REFRESH_TIMEOUT,
-        input_schema=vol.Coerce(float)
+        input_schema=_TO_FLOAT
     ),
     Entry(
         field=CONF_UPDATE,
         optional=True,
         default=0,
-        input_schema=vol.Coerce(float)
+        input_schema=_TO_FLOAT
     ),
     Entry(
         field=CONF_HOLD_MIN,
         optional=True,
         default=DEFAULT_HOLD_MIN,
-        input_schema=vol.Coerce(float)
+        input_schema=_TO_FLOAT
     ),
     Entry(
         field=CONF_HOLD_MAX,
         optional=True,
         default=DEFAULT_HOLD_MAX,
-        input_schema=vol.Coerce(float)
+        input_schema=_TO_FLOAT
     ),
     Entry(
         field=CONF_HOLD_STEP,
         optional=True,
         default=DEFAULT_HOLD_STEP,
-        input_schema=vol.Coerce(float)
+        input_schema=_TO_FLOAT
     ),
-]
+)
 
-def get_input_schema(schema: list[Entry],
-                     excluded: set[str] = {},
-                     defaults: MappingProxyType[str, Any] | None = None) -> dict:
+def _compile_entries(schema: Sequence[Entry]) -> tuple:
+    """ Resolve everything about each entry that doesn't depend on the caller's defaults. """
+    return tuple((entry.field,
+                  vol.Optional if entry.optional else vol.Required,
+                  entry.default,
+                  entry.description,
+                  entry.msg,
+                  entry.input_schema,
+                  entry.input_schema if entry.validating_schema is None else entry.validating_schema)
+                 for entry in schema)
+
+# Keyed by the schema itself, the PP_* tuples of frozen entries are hashable.
+_COMPILED_SCHEMAS = {schema: _compile_entries(schema) for schema in (PP_SCHEMA, PP_SCHEMA_ADV, PP_OPT_SCHEMA)}
+
+def _build_schema(schema: Sequence[Entry],
+                  excluded: frozenset[str],
+                  defaults: MappingProxyType[str, Any] | None,
+                  validating: bool) -> dict:
+    try:
+        compiled = _COMPILED_SCHEMAS.get(schema)
+    except TypeError:
+        # An unhashable sequence of entries, it can't have been compiled in advance.
+        compiled = None
+    if compiled is None:
+        compiled = _compile_entries(schema)
     rv = {}
-    for entry in schema:
-        if not entry["field"] in excluded:
-            if defaults:
-                default = defaults.get(entry["field"], entry.get("default"))
-            else:
-                default = entry.get("default")
-            if entry.get("optional", True):
-                field = vol.Optional(entry["field"], default=default,
-                                     description=entry.get("description"),
-                                     msg=entry.get("msg"))
-            else:
-                field = vol.Required(entry["field"], default=default,
-                                     description=entry.get("description"),
-                                     msg=entry.get("msg"))
-            rv[field] = entry.get("input_schema")
+    for field, marker, default, description, msg, input_schema, validating_schema in compiled:
+        if field in excluded:
+            continue
+        if defaults:
+            default = defaults.get(field, default)
+        rv[marker(field, default=default, description=description, msg=msg)] = \
+            validating_schema if validating else input_schema
     return rv
 
-def get_validating_schema(schema: list[Entry],
-                          excluded: set[str] = {},
+# Config and options flows ask for the same few schemas over and over, keep what was built.
+_SCHEMA_CACHE: dict[tuple, dict] = {}
+_SCHEMA_CACHE_SIZE = 64
+
+def _schema_cache_key(kind: str,
+                      schema: Sequence[Entry],
+                      excluded: frozenset[str],
+                      defaults: MappingProxyType[str, Any] | None) -> tuple | None:
+    key = (kind, schema, frozenset(excluded), tuple(sorted(defaults.items())) if defaults else None)
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        # Unhashable schema or defaults, just build the schema every time.
+        return None
+
+def _cache_schema(key: tuple | None, rv: dict) -> dict:
+    if key is not None:
+        if len(_SCHEMA_CACHE) >= _SCHEMA_CACHE_SIZE:
+            del _SCHEMA_CACHE[next(iter(_SCHEMA_CACHE))]
+        _SCHEMA_CACHE[key] = rv
+    # Callers get their own copy, so the cached schema can't be changed under later callers.
+    return dict(rv)
+
+def get_input_schema(schema: Sequence[Entry],
+                     excluded: frozenset[str] = frozenset(),
+                     defaults: MappingProxyType[str, Any] | None = None) -> dict:
+    key = _schema_cache_key("input", schema, excluded, defaults)
+    if key in _SCHEMA_CACHE:
+        return dict(_SCHEMA_CACHE[key])
+    return _cache_schema(key, _build_schema(schema, excluded, defaults, validating=False))
+
+def get_validating_schema(schema: Sequence[Entry],
+                          excluded: frozenset[str] = frozenset(),
                           defaults: MappingProxyType[str, Any] | None = None) -> dict:
-    rv = {}
-    for entry in schema:
-        if not entry["field"] in excluded:
-            if defaults:
-                default = defaults.get(entry["field"], entry.get("default"))
-            else:
-                default = entry.get("default")
-            if entry.get("optional", True):
-                field = vol.Optional(entry["field"], default=default,
-                                     description=entry.get("description"),
-                                     msg=entry.get("msg"))
-            else:
-                field = vol.Required(entry["field"], default=default,
-                                     description=entry.get("description"),
-                                     msg=entry.get("msg"))
-            rv[field] = entry.get("validating_schema", entry.get("input_schema"))
-    return rv
+    key = _schema_cache_key("validating", schema, excluded, defaults)
+    if key in _SCHEMA_CACHE:
+        return dict(_SCHEMA_CACHE[key])
+    return _cache_schema(key, _build_schema(schema, excluded, defaults, validating=True))
\ No newline at end of file
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import EntityCategory
@@ -11,6 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.sensor import SensorEntity, SensorStateClass, SensorDeviceClass
+from homeassistant.util import dt as dt_util
 from .client import PowerPetDoorClient
 from homeassistant.const import (
     UnitOfTime,
@@ -66,30 +67,47 @@ STATS = {
     },
 }
 
+# (discharging, charging) icons for each 10% of battery charge below full.
+BATTERY_ICONS = (
+    ("mdi:battery-outline", "mdi:battery-charging"),
+    ("mdi:battery-10", "mdi:battery-charging-10"),
+    ("mdi:battery-20", "mdi:battery-charging-20"),
+    ("mdi:battery-30", "mdi:battery-charging-30"),
+    ("mdi:battery-40", "mdi:battery-charging-40"),
+    ("mdi:battery-50", "mdi:battery-charging-50"),
+    ("mdi:battery-60", "mdi:battery-charging-60"),
+    ("mdi:battery-70", "mdi:battery-charging-70"),
+    ("mdi:battery-80", "mdi:battery-charging-80"),
+    ("mdi:battery-90", "mdi:battery-charging-90"),
+)
+
 class PetDoorLatency(CoordinatorEntity, SensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
 
     last_change = None
+    _last_change_iso = None
     def __init__(self,
                  hass: HomeAssistant,
                  client: PowerPetDoorClient,
                  name: str,
-                 device: DeviceInfo | None = None,
-                 update_interval: float | None = None) -> None:
+                 device: DeviceInfo | None = None) -> None:
+        # Firmware only changes across a door restart, and every reconnect already refreshes it.
         coordinator = DataUpdateCoordinator(
             hass=hass,
             logger=_LOGGER,
             name=name,
             update_method=self.update_method,
-            update_interval=timedelta(seconds=update_interval) if update_interval else None)
+            update_interval=None)
         super().__init__(coordinator)
         self.client = client
 
         self._attr_name = name
         self._attr_device_info = device
-        self._attr_unique_id = f"{client.host}:{client.port}-latency"
+        self._attr_unique_id = f"{client.endpoint}-latency"
+        self._device_id = None
+        self._versions = None
 
         self.client.add_listener(self.unique_id, hw_info_update=self.handle_hw_info)
         self.client.add_handlers(name, on_connect=self.coordinator.async_request_refresh, on_ping=self.on_ping)
@@ -124,21 +142,31 @@ class PetDoorLatency(CoordinatorEntity, SensorEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.last_change = datetime.now(timezone.utc)
+        self.last_change = dt_util.utcnow()
+        # Attributes are read at least once per update, format the timestamp once here.
+        self._last_change_iso = self.last_change.isoformat()
 
         if self.coordinator.data:
             hw_version = "{0} rev {1}".format(self.coordinator.data[FIELD_FW_VER], self.coordinator.data[FIELD_FW_REV])
             sw_version = "{0}.{1}.{2}".format(self.coordinator.data[FIELD_FW_MAJOR],
                                               self.coordinator.data[FIELD_FW_MINOR],
                                               self.coordinator.data[FIELD_FW_PATCH])
-            self._attr_device_info[ATTR_HW_VERSION] = hw_version
-            self._attr_device_info[ATTR_SW_VERSION] = sw_version
-            self.async_schedule_update_ha_state()
-
-            registry = async_get_device_registry(self.hass)
-            if registry:
-                device = registry.async_get_device(identifiers=self.device_info[ATTR_IDENTIFIERS])
-                registry.async_update_device(device.id, hw_version=hw_version, sw_version=sw_version)
+            # Firmware rarely changes, only touch the device info and registry when it does.
+            if (hw_version, sw_version) != self._versions:
+                self._attr_device_info[ATTR_HW_VERSION] = hw_version
+                self._attr_device_info[ATTR_SW_VERSION] = sw_version
+                self.async_schedule_update_ha_state()
+
+                registry = async_get_device_registry(self.hass)
+                if registry:
+                    # Our device's registry id never changes, only look it up once.
+                    if self._device_id is None:
+                        device = registry.async_get_device(identifiers=self.device_info[ATTR_IDENTIFIERS])
+                        if device:
+                            self._device_id = device.id
+                    if self._device_id:
+                        registry.async_update_device(self._device_id, hw_version=hw_version, sw_version=sw_version)
+                        self._versions = (hw_version, sw_version)
 
         super()._handle_coordinator_update()
 
@@ -153,7 +181,7 @@ class PetDoorLatency(CoordinatorEntity, SensorEntity):
         if ATTR_SW_VERSION in self.device_info:
             rv[ATTR_SW_VERSION] = self.device_info[ATTR_SW_VERSION]
         if self.last_change:
-            rv[STATE_LAST_CHANGE] = self.last_change.isoformat()
+            rv[STATE_LAST_CHANGE] = self._last_change_iso
         return rv
 
     def handle_hw_info(self, fwinfo: dict) -> None:
@@ -186,10 +214,11 @@ class PetDoorBattery(CoordinatorEntity, SensorEntity):
         self.client = client
 
         self.last_change = None
+        self._last_change_iso = None
 
         self._attr_name = name
         self._attr_device_info = device
-        self._attr_unique_id = f"{client.host}:{client.port}-battery"
+        self._attr_unique_id = f"{client.endpoint}-battery"
 
         self.client.add_listener(self.unique_id, battery_update=self.handle_battery_update)
         self.client.add_handlers(name, on_connect=self.coordinator.async_request_refresh)
@@ -209,64 +238,17 @@ class PetDoorBattery(CoordinatorEntity, SensorEntity):
         if self.native_value is None:
             return "mdi:battery-unknown"
         elif self.battery_present:
-            if self.native_value < 10.0:
-                if self.ac_present:
-                    return "mdi:battery-charging"
-                else:
-                    return "mdi:battery-outline"
-            if self.native_value < 20.0:
-                if self.ac_present:
-                    return "mdi:battery-charging-10"
-                else:
-                    return "mdi:battery-10"
-            elif self.native_value < 30.0:
-                if self.ac_present:
-                    return "mdi:battery-charging-20"
-                else:
-                    return "mdi:battery-20"
-            elif self.native_value < 40.0:
-                if self.ac_present:
-                    return "mdi:battery-charging-30"
-                else:
-                    return "mdi:battery-30"
-            elif self.native_value < 50.0:
-                if self.ac_present:
-                    return "mdi:battery-charging-40"
-                else:
-                    return "mdi:battery-40"
-            elif self.native_value < 60.0:
-                if self.ac_present:
-                    return "mdi:battery-charging-50"
-                else:
-                    return "mdi:battery-50"
-            elif self.native_value < 70.0:
-                if self.ac_present:
-                    return "mdi:battery-charging-60"
-                else:
-                    return "mdi:battery-60"
-            elif self.native_value < 80.0:
-                if self.ac_present:
-                    return "mdi:battery-charging-70"
-                else:
-                    return "mdi:battery-70"
-            elif self.native_value < 90.0:
-                if self.ac_present:
-                    return "mdi:battery-charging-80"
-                else:
-                    return "mdi:battery-80"
-            elif self.native_value < 100.0:
-                if self.ac_present:
-                    return "mdi:battery-charging-90"
-                else:
-                    return "mdi:battery-90"
-            else:
+            if self.native_value >= 100.0:
                 return "mdi:battery"
+            bucket = max(int(self.native_value // 10), 0)
+            return BATTERY_ICONS[bucket][1 if self.ac_present else 0]
         else:
             return "mdi:battery-off-outline"
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.last_change = datetime.now(timezone.utc)
+        self.last_change = dt_util.utcnow()
+        self._last_change_iso = self.last_change.isoformat()
         super()._handle_coordinator_update()
 
     @callback
@@ -284,7 +266,7 @@ class PetDoorBattery(CoordinatorEntity, SensorEntity):
             else:
                 rv[STATE_BATTERY_CHARGING] = False
         if self.last_change:
-            rv[STATE_LAST_CHANGE] = self.last_change.isoformat()
+            rv[STATE_LAST_CHANGE] = self._last_change_iso
         return rv
 
     @property
@@ -311,6 +293,7 @@ class PetDoorStats(CoordinatorEntity, SensorEntity):
         self.sensor = sensor
 
         self.last_change = None
+        self._last_change_iso = None
         self.power = True
 
         self._attr_name = name
@@ -318,7 +301,7 @@ class PetDoorStats(CoordinatorEntity, SensorEntity):
         self._attr_state_class = sensor.get("class")
         self._attr_entity_registry_enabled_default = not sensor.get("disabled", False)
         self._attr_device_info = device
-        self._attr_unique_id = f"{client.host}:{client.port}-{sensor['field']}"
+        self._attr_unique_id = f"{client.endpoint}-{sensor['field']}"
 
         client.add_listener(name=self.unique_id,
                             stats_update={sensor["field"]: self.handle_state_update},
@@ -338,12 +321,13 @@ class PetDoorStats(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self) -> dict | None:
         rv = {}
         if self.last_change:
-            rv[STATE_LAST_CHANGE] = self.last_change.isoformat()
+            rv[STATE_LAST_CHANGE] = self._last_change_iso
         return rv
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.last_change = datetime.now(timezone.utc)
+        self.last_change = dt_util.utcnow()
+        self._last_change_iso = self.last_change.isoformat()
         super()._handle_coordinator_update()
 
     @callback
@@ -375,8 +359,7 @@ async def async_setup_entry(hass: HomeAssistant,
         PetDoorLatency(hass=hass,
                        client=obj["client"],
                        name=f"{name} Latency",
-                       device=obj["device"],
-                       update_interval=entry.options.get(CONF_REFRESH)),
+                       device=obj["device"]),
         PetDoorBattery(hass=hass,
                        client=obj["client"],
                        name=f"{name} Battery",
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 import copy
 
 from homeassistant.core import HomeAssistant, callback
@@ -10,6 +10,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry, SOURCE_IMPORT
 from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
+from homeassistant.util import dt as dt_util
 from .client import PowerPetDoorClient, make_bool
 
 from .const import (
@@ -182,7 +183,7 @@ class PetDoorSwitch(CoordinatorEntity, ToggleEntity):
         self._attr_entity_category = switch.get("category")
         self._attr_entity_registry_enabled_default = not switch.get("disabled", False)
         self._attr_device_info = device
-        self._attr_unique_id = f"{client.host}:{client.port}-{switch['field']}"
+        self._attr_unique_id = f"{client.endpoint}-{switch['field']}"
 
         client.add_listener(name=self.unique_id, sensor_update={switch["field"]: self.handle_state_update})
         if switch["field"] is not FIELD_POWER:
@@ -213,7 +214,7 @@ class PetDoorSwitch(CoordinatorEntity, ToggleEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.last_change = datetime.now(timezone.utc)
+        self.last_change = dt_util.utcnow()
         if self.coordinator.data:
             if self.switch["field"] is not FIELD_POWER and FIELD_POWER in self.coordinator.data:
                 self.power = self.coordinator.data[FIELD_POWER]
@@ -269,7 +270,7 @@ class PetDoorNotificationSwitch(CoordinatorEntity, ToggleEntity):
         if "disabled" in switch:
             self._attr_entity_registry_enabled_default = not switch["disabled"]
         self._attr_device_info = device
-        self._attr_unique_id = f"{client.host}:{client.port}-{switch['field']}"
+        self._attr_unique_id = f"{client.endpoint}-{switch['field']}"
 
         client.add_listener(name=self.unique_id,
                             notifications_update={switch["field"]: self.handle_state_update},
@@ -300,7 +301,7 @@ class PetDoorNotificationSwitch(CoordinatorEntity, ToggleEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.last_change = datetime.now(timezone.utc)
+        self.last_change = dt_util.utcnow()
         super()._handle_coordinator_update()
 
     @callback